@@ -1,23 +1,151 @@
 #!/usr/bin/env python3
+# PYTHON_ARGCOMPLETE_OK
 """
 Gams Master Management Script
 Integrates game adding, deleting, and maintenance tasks.
 """
 
+import argparse
 import os
 import sys
 import re
 import json
+import functools
+import bisect
+import filecmp
+import hashlib
 import shutil
-import requests
+import stat
+import string
+import threading
 import time
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 from typing import List, Dict, Optional, Tuple
 
+# Precompiled patterns and markers used on hot paths
+_WORD_BREAK_RE = re.compile(r'(?<=[a-z])(?=[A-Z])|(?<=[0-9])(?=[a-zA-Z])')
+_FILES_START = b'const files = ['
+_QUOTED_RE = re.compile(r"'([^']+)'")
+_GAMSLIST_RE = re.compile(r'var gamsList = \[(.*?)\];', re.DOTALL)
+_NAME_LINE_RE = re.compile(r'^[^\n]*?name: "([^"]+)"[^\n]*\n?', re.MULTILINE)
+_HREF_RE = re.compile(r'href:\s*"([^"]+)"')
+_ENTRY_RE = re.compile(r'\{([^{}]+)\}')
+_FIELD_RE = re.compile(r'\b(name|href|title):\s*"([^"]+)"')
+_SECTION_END_RE = re.compile(r'^[ \t]*(?:\{title:|\];\s*$)', re.MULTILINE)
+
+# Sections of the gamsList in Gams.html
+SECTIONS = (
+    "Custom",
+    "Basic",
+    "Unity",
+    "Retrogaming",
+    "Henry Stickmin Flash",
+    "Flash",
+    "Tools",
+)
+
+# A UGS game pre-materialized on load: raw ID, ID without 'cl', lowercase, display name
+GameEntry = namedtuple('GameEntry', 'id clean lower display')
+
+# Cached UGS lists are reused outright for a day, then revalidated by ETag/Last-Modified
+UGS_CACHE_MAX_AGE = 24 * 60 * 60
+_NOT_MODIFIED = object()
+
+# Bytes hashed per file to split same-size candidates before full hashing
+_DUPE_PREFIX_BYTES = 4096
+
+
+def _parse_files_array(games_text: bytes) -> List[str]:
+    """Parse the body of the UGS `const files = [...]` array."""
+    # The array is a flat list of single-quoted strings, so it is JSON once
+    # the quotes are swapped; fall back to extracting quoted strings if not
+    try:
+        games = json.loads(b'[' + games_text.replace(b"'", b'"') + b']')
+        return [game for game in games if isinstance(game, str)]
+    except ValueError:
+        return _QUOTED_RE.findall(games_text.decode('utf-8'))
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> os.stat_result:
+    """Write data to path via a synced temp file and os.replace.
+    
+    An interrupted write leaves the previous file intact, and the 1 MiB
+    buffer lets typical files go out in a single write() call. A symlinked
+    path is written at its target, and an existing file keeps its mode.
+    Returns the stat of the written file.
+    """
+    path = Path(os.path.realpath(path))
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+    try:
+        with open(tmp, 'wb', buffering=1 << 20) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            written = os.fstat(f.fileno())
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, path)
+        return written
+    except BaseException:
+        if tmp.exists():
+            os.remove(tmp)
+        raise
+
+
+def _enable_windows_ansi() -> bool:
+    """Enable VT escape processing on the Windows console, if possible."""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _get_game_name(game_id: str) -> str:
+    """Convert UGS game ID to readable name (memoized; the UGS ID set is bounded)."""
+    if game_id.startswith('cl'):
+        clean_name = game_id[2:]
+    else:
+        clean_name = game_id
+        
+    # Add spaces at camelCase and digit-to-letter boundaries in a single
+    # regex pass, skipped when the ID can contain neither, then capitalize
+    name = clean_name
+    if not name.islower() or any(c.isdigit() for c in name):
+        name = _WORD_BREAK_RE.sub(' ', name)
+    # str.title() matches per-word capitalize once digits are split from
+    # letters; punctuation (e.g. "slither.io") needs capwords semantics
+    if clean_name.isascii() and clean_name.isalnum():
+        name = name.title()
+    else:
+        name = string.capwords(name)
+    
+    return name
+
 # --- GamsGameAdder Logic (Integrated) ---
 
 class GamsManager:
+    # Lowercases ASCII and drops whitespace in a single translate() pass,
+    # mirroring the page's name.toLowerCase().replace(/\s/g, '')
+    _FILENAME_TABLE = str.maketrans(
+        {**{c: None for c in string.whitespace},
+         **{c: c.lower() for c in string.ascii_uppercase}}
+    )
+    
     def __init__(self):
         self.base_dir = Path("/workspaces/Gams")
         self.games_dir = self.base_dir / "g" / "g"
@@ -25,46 +153,119 @@ class GamsManager:
         self.gams_html = self.base_dir / "Gams.html"
         self.ugs_base_url = "https://cdn.jsdelivr.net/gh/bubbls/ugs-singlefile"
         self.default_image = self.img_dir / "gams.png"
+        self.ugs_cache_path = Path.home() / ".cache" / "gams" / "ugs-games.json"
         
         # Available sections from Gams.html
-        self.sections = [
-            "Custom",
-            "Basic", 
-            "Unity",
-            "Retrogaming",
-            "Henry Stickmin Flash",
-            "Flash",
-            "Tools"
-        ]
+        self.sections = list(SECTIONS)
+        self._section_re = re.compile(
+            r'\{title: "(' + '|'.join(re.escape(s) for s in self.sections) + r')", type: "section"\}'
+        )
         
-        # Cache for UGS games list
+        # Cache for UGS games list, plus lookup indexes built on load
         self.ugs_games = []
+        self._ugs_entries: List[GameEntry] = []
+        self._sorted_entries: List[GameEntry] = []
+        self._sorted_lower: List[str] = []
+        self._letters_cache: List[str] = []
+        self._last_search: Tuple[str, List[GameEntry]] = ('', [])
+        
+        # In-memory copy of Gams.html shared by every edit, with section
+        # marker offsets; flush() writes it back when dirty
+        self._gams_content: Optional[str] = None
+        self._section_index: Dict[str, int] = {}
+        self._gams_dirty = False
+        self._entries_cache: Optional[List[Dict]] = None
+        # (st_mtime_ns, st_size) of the file the buffer was read from or last
+        # written to, so outside edits are picked up instead of overwritten
+        self._gams_stamp: Optional[Tuple[int, int]] = None
+        
+        # Whether clear_screen can use ANSI escapes (decided on first use)
+        self._ansi_clear: Optional[bool] = None
+        
+        # The games directory is created lazily, once per session
+        self._games_dir_ready = False
+        
+        # Shared HTTP session, built on first network use; the lock keeps
+        # parallel downloads from each building their own
+        self._session = None
+        self._session_lock = threading.Lock()
+    
+    @property
+    def session(self):
+        """Shared HTTP session so CDN downloads reuse keep-alive connections.
+        
+        requests is imported here rather than at module load, so commands
+        that never touch the network don't pay for it.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    from urllib3.util.retry import Retry
+                    
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=4,
+                        pool_maxsize=8,
+                        max_retries=Retry(total=3, backoff_factor=0.3)
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers.update({'Accept-Encoding': 'gzip'})
+                    # Published only once fully configured
+                    self._session = session
+        return self._session
 
     def clear_screen(self):
         """Clear the console screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # An ANSI escape avoids spawning a clear/cls process on every redraw
+        if self._ansi_clear is None:
+            self._ansi_clear = os.name != 'nt' or _enable_windows_ansi()
+        if self._ansi_clear:
+            sys.stdout.write('\x1b[2J\x1b[H')
+            sys.stdout.flush()
+        else:
+            os.system('cls')
 
     # --- Adder Functionality ---
 
     def load_ugs_games(self) -> List[str]:
-        """Load the list of games from UGS source."""
+        """Load the list of games from UGS source (cached on disk)."""
         if self.ugs_games:
             return self.ugs_games
             
         try:
-            url = "https://cdn.jsdelivr.net/gh/bubbls/ugs-singlefile@main/AASINGLEFILE.html"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            # Extract games list from JavaScript
-            content = response.text
-            games_match = re.search(r'const files = \[(.*?)\];', content, re.DOTALL)
+            cache = self._read_ugs_cache()
+            if cache and time.time() - cache['mtime'] < UGS_CACHE_MAX_AGE:
+                games = cache['games']
+            else:
+                # Prefer the small JSON manifest, fall back to scraping the page;
+                # either one may answer 304 Not Modified for the cached validators
+                from requests import RequestException
+                
+                headers = self._conditional_headers(cache)
+                games, validators = self._fetch_ugs_manifest(headers)
+                if games is None:
+                    try:
+                        games, validators = self._scrape_ugs_games(headers)
+                    except RequestException as e:
+                        if not cache:
+                            raise
+                        # Offline: a stale list beats no list
+                        print(f"⚠️  Could not refresh UGS games ({e}); using cached list")
+                        games, validators = cache['games'], None
+                
+                if games is _NOT_MODIFIED:
+                    games = cache['games']
+                    self.ugs_cache_path.touch()
+                elif games is not None and validators is not None:
+                    # Only freshly fetched lists are written; a stale fallback is not
+                    self._write_ugs_cache(games, validators)
             
-            if games_match:
-                games_text = games_match.group(1)
-                # Extract all quoted strings
-                games = re.findall(r"'([^']+)'", games_text)
+            if games is not None:
                 self.ugs_games = [game for game in games if game.startswith('cl')]
+                self._index_ugs_games()
                 print(f"✓ Loaded {len(self.ugs_games)} games from UGS")
                 return self.ugs_games
             else:
@@ -75,68 +276,200 @@ class GamsManager:
             print(f"✗ Error loading UGS games: {e}")
             return []
     
+    def _read_ugs_cache(self) -> Optional[Dict]:
+        """Read the on-disk UGS games cache, or None if missing or corrupt."""
+        try:
+            mtime = self.ugs_cache_path.stat().st_mtime
+            cache = json.loads(self.ugs_cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        
+        # Anything but the shape _write_ugs_cache produces is a cache miss,
+        # so a damaged file gets refetched and rewritten
+        if not isinstance(cache, dict):
+            return None
+        games = cache.get('games')
+        if not isinstance(games, list) or not all(isinstance(game, str) for game in games):
+            return None
+        if not all(isinstance(cache.get(key), (str, type(None))) for key in ('etag', 'last_modified')):
+            return None
+        cache['mtime'] = mtime
+        return cache
+    
+    def _write_ugs_cache(self, games: List[str], validators: Dict[str, Optional[str]]):
+        """Persist the UGS games list with its HTTP validators; failures are not fatal."""
+        try:
+            self.ugs_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Only 'cl' IDs are ever used, and compact separators keep the file small
+            data = {**validators, 'games': [game for game in games if game.startswith('cl')]}
+            _atomic_write_bytes(self.ugs_cache_path, json.dumps(data, separators=(',', ':')).encode('utf-8'))
+        except OSError as e:
+            print(f"⚠️  Could not write UGS cache: {e}")
+    
+    @staticmethod
+    def _conditional_headers(cache: Optional[Dict]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from a cache entry."""
+        headers = {}
+        if cache:
+            if cache.get('etag'):
+                headers['If-None-Match'] = cache['etag']
+            if cache.get('last_modified'):
+                headers['If-Modified-Since'] = cache['last_modified']
+        return headers
+    
+    @staticmethod
+    def _response_validators(response) -> Dict[str, Optional[str]]:
+        """Collect the ETag and Last-Modified headers of a response."""
+        return {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+    
+    def _fetch_ugs_manifest(self, headers: Optional[Dict[str, str]] = None) -> Tuple[Optional[List[str]], Optional[Dict]]:
+        """Fetch the UGS files.json manifest as (games, validators).
+        
+        games is None if the manifest is unavailable, or _NOT_MODIFIED on a 304.
+        """
+        from requests import RequestException
+        
+        try:
+            response = self.session.get(f"{self.ugs_base_url}@main/files.json", headers=headers, timeout=5)
+            if response.status_code == 304:
+                return _NOT_MODIFIED, None
+            if response.status_code != 200:
+                return None, None
+            data = response.json()
+        except (RequestException, ValueError):
+            return None, None
+        
+        # Accept either a bare list or {"files": [...]}
+        if isinstance(data, dict):
+            data = data.get('files')
+        if not isinstance(data, list):
+            return None, None
+        return [game for game in data if isinstance(game, str)], self._response_validators(response)
+    
+    def _scrape_ugs_games(self, headers: Optional[Dict[str, str]] = None) -> Tuple[Optional[List[str]], Optional[Dict]]:
+        """Extract the games list from the UGS single-file page as (games, validators)."""
+        url = f"{self.ugs_base_url}@main/AASINGLEFILE.html"
+        # Stream the page and stop as soon as the games list is complete.
+        # Plain find() calls scan only the newly arrived bytes.
+        buf = bytearray()
+        start = -1
+        with self.session.get(url, headers=headers, stream=True, timeout=10) as response:
+            if response.status_code == 304:
+                return _NOT_MODIFIED, None
+            response.raise_for_status()
+            validators = self._response_validators(response)
+            for chunk in response.iter_content(chunk_size=65536):
+                prev_len = len(buf)
+                buf += chunk
+                if start == -1:
+                    start = buf.find(_FILES_START, max(0, prev_len - len(_FILES_START) + 1))
+                    if start == -1:
+                        continue
+                    start += len(_FILES_START)
+                end = buf.find(b'];', max(start, prev_len - 1))
+                if end != -1:
+                    return _parse_files_array(bytes(buf[start:end])), validators
+        
+        return None, None
+    
+    def _index_ugs_games(self):
+        """Precompute names and the per-letter index for UGS games."""
+        # ugs_games only holds 'cl' IDs, so the prefix is stripped exactly once here
+        self._ugs_entries = [
+            GameEntry(game, game[2:], game[2:].lower(), _get_game_name(game))
+            for game in self.ugs_games
+        ]
+        # Entries sorted by lowercase name make prefix lookups a bisect
+        self._sorted_entries = sorted(self._ugs_entries, key=lambda entry: entry.lower)
+        self._sorted_lower = [entry.lower for entry in self._sorted_entries]
+        self._letters_cache = sorted({entry.clean[0].upper() for entry in self._ugs_entries if entry.clean})
+        self._last_search = ('', [])
+    
     def search_games(self, query: str) -> List[str]:
         """Search for games by name."""
-        games = self.load_ugs_games()
+        self.load_ugs_games()
         query = query.lower()
         
-        matches = []
-        for game in games:
-            # Remove 'cl' prefix for searching
-            clean_name = game[2:] if game.startswith('cl') else game
-            if query in clean_name.lower():
-                matches.append(game)
-        
-        return matches
+        # A query containing the previous one can only match a subset of its hits
+        last_query, last_hits = self._last_search
+        candidates = last_hits if last_query and last_query in query else self._ugs_entries
+        hits = [entry for entry in candidates if query in entry.lower]
+        self._last_search = (query, hits)
+        return [entry.id for entry in hits]
+    
+    def _entries_with_prefix(self, prefix: str) -> List[GameEntry]:
+        """Return UGS entries whose lowercase name starts with prefix, in O(log N)."""
+        prefix = prefix.lower()
+        lo = bisect.bisect_left(self._sorted_lower, prefix)
+        hi = bisect.bisect_right(self._sorted_lower, prefix + '\U0010ffff', lo)
+        return self._sorted_entries[lo:hi]
+    
+    def search_entries_prefix(self, prefix: str) -> List[GameEntry]:
+        """Return UGS entries whose name starts with prefix, sorted by name."""
+        self.load_ugs_games()
+        return self._entries_with_prefix(prefix)
+    
+    def available_letters(self) -> List[str]:
+        """Return the uppercase first letters of UGS game names, sorted."""
+        self.load_ugs_games()
+        return self._letters_cache
     
     def get_game_name(self, game_id: str) -> str:
         """Convert UGS game ID to readable name."""
+        return _get_game_name(game_id)
+    
+    def game_file_path(self, game_id: str) -> Path:
+        """Return where a game's HTML file is stored."""
+        # Use game_id as filename (remove 'cl' prefix)
+        filename = f"{game_id}.html"
         if game_id.startswith('cl'):
-            clean_name = game_id[2:]
-        else:
-            clean_name = game_id
+            filename = f"{game_id[2:]}.html"
             
-        # Add spaces and capitalize
-        name = re.sub(r'([a-z])([A-Z])', r'\1 \2', clean_name)
-        name = re.sub(r'([0-9])([a-zA-Z])', r'\1 \2', name)
-        name = ' '.join(word.capitalize() for word in name.split())
-        
-        return name
+        return self.games_dir / filename
     
-    def download_game(self, game_id: str) -> Optional[str]:
-        """Download game HTML from UGS."""
+    def download_game(self, game_id: str) -> Optional[Path]:
+        """Download game HTML from UGS straight into its game file."""
+        filepath = self.game_file_path(game_id)
+        
+        # Create directory if it doesn't exist (once per session)
+        if not self._games_dir_ready:
+            self.games_dir.mkdir(parents=True, exist_ok=True)
+            self._games_dir_ready = True
+        
+        tmp = filepath.with_suffix(filepath.suffix + '.tmp')
         try:
             url = f"{self.ugs_base_url}/{game_id}.html"
-            response = requests.get(url, timeout=15)
-            response.raise_for_status()
+            # Stream the body to a temp file without decoding it to text and
+            # back, then swap it in so an interrupted download never truncates
+            with self.session.get(url, stream=True, timeout=15) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(tmp, 'wb', buffering=1 << 20) as f:
+                    shutil.copyfileobj(response.raw, f, 64 * 1024)
+            os.replace(tmp, filepath)
             
-            return response.text
+            return filepath
             
         except Exception as e:
             print(f"✗ Error downloading {game_id}: {e}")
+            if tmp.exists():
+                os.remove(tmp)
             return None
     
-    def save_game_file(self, game_id: str, content: str) -> Path:
-        """Save game file to appropriate location."""
-        # Use game_id as filename (remove 'cl' prefix)
-        filename = f"{game_id}.html"
-        if game_id.startswith('cl'):
-            filename = f"{game_id[2:]}.html"
-            
-        filepath = self.games_dir / filename
-        
-        # Create directory if it doesn't exist
-        self.games_dir.mkdir(parents=True, exist_ok=True)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        return filepath
+    def _img_basename(self, game_name: str) -> str:
+        """Derive the thumbnail/page basename the site uses for a game name."""
+        if not game_name.isascii():
+            # Unicode whitespace is outside the table, so split it away too
+            return ''.join(game_name.lower().split())
+        return game_name.translate(self._FILENAME_TABLE)
     
     def create_game_image(self, game_name: str) -> Path:
         """Create game thumbnail using default Gams logo."""
         # Convert game name to filename
-        img_filename = f"{game_name.lower().replace(' ', '')}.png"
+        img_filename = f"{self._img_basename(game_name)}.png"
         img_path = self.img_dir / img_filename
         
         # Copy default image if it doesn't exist
@@ -146,66 +479,164 @@ class GamsManager:
         
         return img_path
     
+    def _load_gams_content(self) -> str:
+        """Read Gams.html and index where each section marker starts.
+        
+        The buffer is reused until the file changes on disk; pending edits
+        are kept as they are.
+        """
+        if self._gams_content is not None and not self._gams_dirty:
+            try:
+                st = self.gams_html.stat()
+                changed = (st.st_mtime_ns, st.st_size) != self._gams_stamp
+            except OSError:
+                changed = True
+            if changed:
+                self._gams_content = None
+        
+        if self._gams_content is None:
+            # Raw bytes plus one decode skips the text layer's newline
+            # translation pass; line endings round-trip unchanged on flush
+            with open(self.gams_html, 'rb') as f:
+                st = os.fstat(f.fileno())
+                data = f.read()
+            self._set_gams_content(data.decode('utf-8'))
+            self._gams_dirty = False
+            self._gams_stamp = (st.st_mtime_ns, st.st_size)
+        
+        return self._gams_content
+    
+    def _set_gams_content(self, content: str):
+        """Replace the cached Gams.html content and re-index its sections."""
+        self._gams_content = content
+        self._entries_cache = None
+        
+        # One scan records the first marker offset of every known section
+        self._section_index = {}
+        for match in self._section_re.finditer(content):
+            self._section_index.setdefault(match.group(1), match.start())
+        self._gams_dirty = True
+    
+    def flush(self) -> bool:
+        """Write pending gamsList edits back to Gams.html."""
+        if not self._gams_dirty:
+            return True
+        try:
+            st = _atomic_write_bytes(self.gams_html, self._gams_content.encode('utf-8'))
+            self._gams_dirty = False
+            self._gams_stamp = (st.st_mtime_ns, st.st_size)
+            return True
+        except Exception as e:
+            print(f"✗ Error writing Gams.html: {e}")
+            return False
+    
+    def _gams_checkpoint(self) -> Tuple[str, bool]:
+        """Snapshot the buffer so a failed operation can undo its edits."""
+        return self._load_gams_content(), self._gams_dirty
+    
+    def _gams_rollback(self, checkpoint: Optional[Tuple[str, bool]]):
+        """Restore a _gams_checkpoint() snapshot, dropping any later edits."""
+        if checkpoint is None or checkpoint[0] is self._gams_content:
+            return
+        content, dirty = checkpoint
+        self._set_gams_content(content)
+        self._gams_dirty = dirty
+    
     def find_section_in_gams_list(self, section: str) -> int:
         """Find the line number where a section starts in gamsList."""
         try:
-            with open(self.gams_html, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            section_pattern = f'{{title: "{section}", type: "section"}}'
-            
-            for i, line in enumerate(lines):
-                if section_pattern in line:
-                    return i + 1  # Return 1-based line number
-            
-            return -1
+            content = self._load_gams_content()
+            section_pos = self._section_index.get(section, -1)
+            if section_pos == -1:
+                return -1
+            return content.count('\n', 0, section_pos) + 1  # Return 1-based line number
             
         except Exception as e:
             print(f"✗ Error finding section: {e}")
             return -1
     
-    def add_game_to_gams_list(self, game_name: str, section: str, custom_path: Optional[str] = None) -> bool:
-        """Add game to the gamsList array in Gams.html."""
+    def _insert_into_section(self, section: str, block: str) -> bool:
+        """Splice pre-formatted entry lines at the end of a section in memory."""
+        content = self._load_gams_content()
+        
+        # Find the section
+        section_pos = self._section_index.get(section, -1)
+        if section_pos == -1:
+            print(f"✗ Section '{section}' not found")
+            return False
+        
+        # The section ends at the next section marker or the end of the array
+        line_end = content.find('\n', section_pos)
+        if line_end == -1:
+            insert_pos, block = len(content), '\n' + block
+        else:
+            end_match = _SECTION_END_RE.search(content, line_end + 1)
+            insert_pos = end_match.start() if end_match else len(content)
+        
+        # Splice the block in and shift the sections that follow it
+        self._gams_content = content[:insert_pos] + block + content[insert_pos:]
+        self._entries_cache = None
+        for name, pos in self._section_index.items():
+            if pos >= insert_pos:
+                self._section_index[name] = pos + len(block)
+        self._gams_dirty = True
+        return True
+    
+    @staticmethod
+    def _format_gams_entry(game_name: str, custom_path: Optional[str] = None) -> str:
+        """Format one gamsList entry line."""
+        if custom_path:
+            return f'  {{name: "{game_name}", href: "{custom_path}"}},\n'
+        return f'  {{name: "{game_name}"}},\n'
+    
+    def add_game_to_gams_list(self, game_name: str, section: str, custom_path: Optional[str] = None,
+                              flush: bool = True) -> bool:
+        """Add game to the gamsList array in Gams.html.
+        
+        With flush=False the edit stays in memory until flush() is called,
+        so a batch of adds costs a single read and a single write.
+        """
+        checkpoint = None
         try:
-            with open(self.gams_html, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Find the section
-            section_line = self.find_section_in_gams_list(section)
-            if section_line == -1:
-                print(f"✗ Section '{section}' not found")
+            checkpoint = self._gams_checkpoint()
+            if not self._insert_into_section(section, self._format_gams_entry(game_name, custom_path)):
                 return False
             
-            lines = content.split('\n')
-            
-            # Find the end of the section (next section or end of array)
-            insert_line = section_line
-            for i in range(section_line, len(lines)):
-                line = lines[i].strip()
-                if line.startswith('{title:') and i > section_line:
-                    break
-                if line == '];':
-                    break
-                insert_line = i + 1
+            # Write back to file; a failed write leaves no queued edit behind
+            if flush and not self.flush():
+                self._gams_rollback(checkpoint)
+                return False
             
-            # Create game entry
-            if custom_path:
-                game_entry = f'{{name: "{game_name}", href: "{custom_path}"}}'
-            else:
-                game_entry = f'{{name: "{game_name}"}}'
+            print(f"✓ Added '{game_name}' to '{section}' section")
+            return True
             
-            # Insert the game entry
-            lines.insert(insert_line, f'  {game_entry},')
+        except Exception as e:
+            self._gams_rollback(checkpoint)
+            print(f"✗ Error adding game to gamsList: {e}")
+            return False
+    
+    def add_games_to_section(self, entries: List[Tuple[str, Optional[str]]], section: str,
+                             flush: bool = True) -> bool:
+        """Add several (game_name, custom_path) entries to one section in a single splice."""
+        if not entries:
+            return True
+        checkpoint = None
+        try:
+            checkpoint = self._gams_checkpoint()
+            block = ''.join(self._format_gams_entry(name, path) for name, path in entries)
+            if not self._insert_into_section(section, block):
+                return False
             
-            # Write back to file
-            with open(self.gams_html, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(lines))
+            if flush and not self.flush():
+                self._gams_rollback(checkpoint)
+                return False
             
-            print(f"✓ Added '{game_name}' to '{section}' section")
+            print(f"✓ Added {len(entries)} games to '{section}' section")
             return True
             
         except Exception as e:
-            print(f"✗ Error adding game to gamsList: {e}")
+            self._gams_rollback(checkpoint)
+            print(f"✗ Error adding games to gamsList: {e}")
             return False
     
     def add_game(self, game_id: str, section: str, use_custom_image: bool = False) -> bool:
@@ -213,20 +644,20 @@ class GamsManager:
         game_name = self.get_game_name(game_id)
         return self.add_game_with_name(game_id, game_name, section, use_custom_image)
     
-    def add_game_with_name(self, game_id: str, game_name: str, section: str, use_custom_image: bool = False) -> bool:
-        """Add a complete game to Gams with custom name."""
+    def add_game_with_name(self, game_id: str, game_name: str, section: str, use_custom_image: bool = False,
+                           flush: bool = True) -> bool:
+        """Add a complete game to Gams with custom name.
+        
+        With flush=False the gamsList edit is queued in memory until flush().
+        """
         print(f"\n🎮 Adding game: {game_id}")
         print(f"📝 Game name: {game_name}")
         
         # Download game
         print("⬇️  Downloading game...")
-        content = self.download_game(game_id)
-        if not content:
+        game_path = self.download_game(game_id)
+        if not game_path:
             return False
-        
-        # Save game file
-        print("💾 Saving game file...")
-        game_path = self.save_game_file(game_id, content)
         print(f"✓ Saved to: {game_path}")
         
         # Create custom path for gamsList
@@ -241,7 +672,7 @@ class GamsManager:
         
         # Add to gamsList
         print("📋 Adding to game list...")
-        success = self.add_game_to_gams_list(game_name, section, custom_path)
+        success = self.add_game_to_gams_list(game_name, section, custom_path, flush=flush)
         
         if success:
             print(f"🎉 Successfully added '{game_name}' to Gams!")
@@ -250,140 +681,248 @@ class GamsManager:
             print(f"❌ Failed to add '{game_name}'")
             return False
 
+    def add_games(self, games: List[Tuple[str, str]], use_custom_image: bool = False) -> int:
+        """Add several (game_id, section) pairs, downloading them in parallel."""
+        if not games:
+            return 0
+        
+        # Downloads are pure network wait, so overlap them on the session pool
+        print(f"\n⬇️  Downloading {len(games)} games...")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            game_paths = list(executor.map(self.download_game, [game_id for game_id, _ in games]))
+        
+        # Group the gamsList entries of the downloaded games by section
+        by_section: Dict[str, List[Tuple[str, Optional[str]]]] = defaultdict(list)
+        for (game_id, section), game_path in zip(games, game_paths):
+            if not game_path:
+                continue
+            game_name = self.get_game_name(game_id)
+            print(f"✓ Saved to: {game_path}")
+            if not use_custom_image:
+                self.create_game_image(game_name)
+            by_section[section].append((game_name, f"g/g/{game_path.name}"))
+        
+        # One splice per section and one rewrite of Gams.html for the whole batch
+        try:
+            checkpoint = self._gams_checkpoint()
+        except Exception as e:
+            print(f"✗ Error adding games to gamsList: {e}")
+            return 0
+        added = 0
+        for section, entries in by_section.items():
+            if self.add_games_to_section(entries, section, flush=False):
+                added += len(entries)
+        if added and not self.flush():
+            self._gams_rollback(checkpoint)
+            return 0
+        
+        print(f"🎉 Added {added}/{len(games)} games to Gams!")
+        return added
+    
+    def add_games_batch(self, game_ids: List[str], section: str, use_custom_image: bool = False) -> int:
+        """Add several games to one section, downloading them in parallel."""
+        return self.add_games([(game_id, section) for game_id in game_ids], use_custom_image)
+
     # --- Deletion Functionality ---
 
     def parse_gams_list(self) -> List[Dict]:
-        """Parse the gamsList from Gams.html into a structured list."""
+        """Parse the gamsList from Gams.html into a structured list.
+        
+        The result is cached until Gams.html is edited or changes on disk.
+        """
         try:
-            with open(self.gams_html, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            match = re.search(r'var gamsList = \[(.*?)\];', content, re.DOTALL)
-            if not match:
-                print("✗ Could not find gamsList in Gams.html")
-                return []
-            
-            list_content = match.group(1)
-            
-            # This is a simple parser for the JS object format used in Gams.html
-            # It assumes objects are separated by commas and properties are clear
-            # Ideally we would use a JS parser, but regex will suffice for this specific file structure
-            entries = []
-            
-            # Split by closing brace and comma to separate objects
-            # We need to be careful about the splitting
-            raw_entries = re.findall(r'\{[^{}]+\}', list_content)
-            
-            for raw in raw_entries:
-                entry = {}
-                # Extract name
-                name_match = re.search(r'name:\s*"([^"]+)"', raw)
-                if name_match:
-                    entry['name'] = name_match.group(1)
-                
-                # Extract href
-                href_match = re.search(r'href:\s*"([^"]+)"', raw)
-                if href_match:
-                    entry['href'] = href_match.group(1)
-                    
-                # Extract title (for sections)
-                title_match = re.search(r'title:\s*"([^"]+)"', raw)
-                if title_match:
-                    entry['title'] = title_match.group(1)
-                    entry['type'] = 'section'
-                
-                entries.append(entry)
-                
-            return entries
-            
+            # Reloads (and drops the cache) if Gams.html changed on disk
+            self._load_gams_content()
+            if self._entries_cache is None:
+                self._entries_cache = self._parse_gams_list_uncached()
         except Exception as e:
             print(f"✗ Error parsing Gams list: {e}")
             return []
+        return self._entries_cache
+    
+    def _parse_gams_list_uncached(self) -> List[Dict]:
+        """Parse the cached Gams.html content into gamsList entries."""
+        content = self._load_gams_content()
+        
+        match = _GAMSLIST_RE.search(content)
+        if not match:
+            print("✗ Could not find gamsList in Gams.html")
+            return []
+        
+        list_content = match.group(1)
+        
+        # This is a simple parser for the JS object format used in Gams.html
+        # It assumes objects are separated by commas and properties are clear
+        # Ideally we would use a JS parser, but regex will suffice for this specific file structure
+        entries = []
+        
+        # One pass over the list for objects, one pass per object for its
+        # name/href/title fields
+        for raw in _ENTRY_RE.finditer(list_content):
+            entry = dict(_FIELD_RE.findall(raw.group(1)))
+            
+            # Titles mark sections
+            if 'title' in entry:
+                entry['type'] = 'section'
+            
+            entries.append(entry)
+            
+        return entries
 
     def delete_game(self, game_name: str) -> bool:
         """Delete a game from Gams.html and filesystem."""
         print(f"\n🗑️  Deleting game: {game_name}")
         
+        checkpoint = None
         try:
-            with open(self.gams_html, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            new_lines = []
-            deleted = False
-            game_href = None
-            
-            # Find and remove line from Gams.html
-            for line in lines:
-                if f'name: "{game_name}"' in line:
-                    deleted = True
-                    # Try to extract href to delete file
-                    href_match = re.search(r'href:\s*"([^"]+)"', line)
-                    if href_match:
-                        game_href = href_match.group(1)
-                    else:
-                        # Fallback to default path: g/<name>.html
-                        img_name = game_name.lower().replace(' ', '')
-                        game_href = f"g/{img_name}.html"
-                    continue
-                new_lines.append(line)
-            
-            if not deleted:
-                print(f"✗ Game '{game_name}' not found in Gams.html")
+            checkpoint = self._gams_checkpoint()
+            game_href = self._remove_gams_entry(game_name)
+            if game_href is None:
                 return False
             
-            # Write updated Gams.html
-            with open(self.gams_html, 'w', encoding='utf-8') as f:
-                f.writelines(new_lines)
+            # Write updated Gams.html; if that fails the entry stays listed
+            if not self.flush():
+                self._gams_rollback(checkpoint)
+                return False
             print("✓ Removed entry from Gams.html")
             
-            # Delete files
-            if game_href:
-                # Resolve path relative to workspace root
-                # href is usually like "g/g/game.html"
-                file_path = self.base_dir / game_href
-                
-                if file_path.exists():
-                    # If it's a directory (some Unity games), delete directory
-                    if file_path.is_dir():
-                        shutil.rmtree(file_path)
-                        print(f"✓ Deleted directory: {file_path}")
-                    else:
-                        # Check if it's inside a subdirectory in g/g/ that should also be deleted
-                        # E.g., g/g/cookie/index.html -> delete g/g/cookie/
-                        parts = Path(game_href).parts
-                        if len(parts) > 3 and parts[0] == 'g' and parts[1] == 'g':
-                            # It's in a subdir like g/g/subdir/file.html
-                            subdir = self.base_dir / parts[0] / parts[1] / parts[2]
-                            if subdir.exists() and subdir.is_dir():
-                                shutil.rmtree(subdir)
-                                print(f"✓ Deleted game directory: {subdir}")
-                            else:
-                                os.remove(file_path)
-                                print(f"✓ Deleted file: {file_path}")
-                        else:
-                            os.remove(file_path)
-                            print(f"✓ Deleted file: {file_path}")
-                else:
-                    print(f"⚠️  File not found at {file_path}")
-            
-            # Delete thumbnail
-            img_name = game_name.lower().replace(' ', '') + ".png"
-            img_path = self.img_dir / img_name
-            if img_path.exists():
-                os.remove(img_path)
-                print(f"✓ Deleted thumbnail: {img_path}")
-                
+            self._delete_game_files(game_name, game_href)
             print(f"🎉 Successfully deleted '{game_name}'")
             return True
             
         except Exception as e:
+            # Only unwritten entry removals are undone; once flushed they stand
+            if self._gams_dirty:
+                self._gams_rollback(checkpoint)
             print(f"✗ Error deleting game: {e}")
             return False
+    
+    def delete_games(self, game_names: List[str]) -> int:
+        """Delete several games, rewriting Gams.html once and removing files in parallel."""
+        print(f"\n🗑️  Deleting {len(game_names)} games...")
+        
+        checkpoint = None
+        try:
+            checkpoint = self._gams_checkpoint()
+            removed = []
+            for game_name in game_names:
+                game_href = self._remove_gams_entry(game_name)
+                if game_href is not None:
+                    removed.append((game_name, game_href))
+            if not removed:
+                return 0
+            
+            # Entries go before files, as in delete_game
+            if not self.flush():
+                self._gams_rollback(checkpoint)
+                return 0
+            print(f"✓ Removed {len(removed)} entries from Gams.html")
+        except Exception as e:
+            # Nothing was written, so every game stays listed
+            self._gams_rollback(checkpoint)
+            print(f"✗ Error deleting games: {e}")
+            return 0
+        
+        def delete_files(item: Tuple[str, str]) -> bool:
+            try:
+                self._delete_game_files(*item)
+                return True
+            except Exception as e:
+                print(f"✗ Error deleting files for '{item[0]}': {e}")
+                return False
+        
+        # Each game owns its own files and thumbnail, so removals can overlap
+        with ThreadPoolExecutor(max_workers=min(8, len(removed))) as executor:
+            deleted = sum(executor.map(delete_files, removed))
+        
+        print(f"🎉 Deleted {deleted}/{len(game_names)} games")
+        return deleted
+    
+    def _remove_gams_entry(self, game_name: str) -> Optional[str]:
+        """Drop a game's gamsList line(s) from the buffer and return its href.
+        
+        Returns None if the game is not listed; the edit is not flushed.
+        """
+        content = self._load_gams_content()
+        
+        # Find and remove the entry's line(s) in one pass over the content,
+        # without splitting it into a list of lines
+        removed_lines = []
+        
+        def drop_line(match):
+            removed_lines.append(match.group(0))
+            return ''
+        
+        entry_line_re = re.compile(
+            r'^[^\n]*name: "' + re.escape(game_name) + r'"[^\n]*\n?', re.MULTILINE
+        )
+        new_content = entry_line_re.sub(drop_line, content)
+        
+        if not removed_lines:
+            print(f"✗ Game '{game_name}' not found in Gams.html")
+            return None
+        
+        self._set_gams_content(new_content)
+        
+        # Try to extract href to delete file
+        href_match = _HREF_RE.search(removed_lines[-1])
+        if href_match:
+            return href_match.group(1)
+        # Fallback to default path: g/<name>.html
+        return f"g/{self._img_basename(game_name)}.html"
+    
+    def _delete_game_files(self, game_name: str, game_href: str):
+        """Delete a game's file or directory and its thumbnail."""
+        if game_href:
+            # Resolve path relative to workspace root
+            # href is usually like "g/g/game.html"
+            file_path = self.base_dir / game_href
+            
+            # One stat answers both "does it exist" and "is it a directory"
+            try:
+                file_mode = file_path.stat().st_mode
+            except OSError:
+                file_mode = None
+            
+            if file_mode is not None:
+                # If it's a directory (some Unity games), delete directory
+                if stat.S_ISDIR(file_mode):
+                    shutil.rmtree(file_path)
+                    print(f"✓ Deleted directory: {file_path}")
+                else:
+                    # Check if it's inside a subdirectory in g/g/ that should also be deleted
+                    # E.g., g/g/cookie/index.html -> delete g/g/cookie/
+                    parts = Path(game_href).parts
+                    if len(parts) > 3 and parts[0] == 'g' and parts[1] == 'g':
+                        # It's in a subdir like g/g/subdir/file.html
+                        subdir = self.base_dir / parts[0] / parts[1] / parts[2]
+                        if subdir.is_dir():
+                            shutil.rmtree(subdir)
+                            print(f"✓ Deleted game directory: {subdir}")
+                        else:
+                            os.remove(file_path)
+                            print(f"✓ Deleted file: {file_path}")
+                    else:
+                        os.remove(file_path)
+                        print(f"✓ Deleted file: {file_path}")
+            else:
+                print(f"⚠️  File not found at {file_path}")
+        
+        # Delete thumbnail
+        img_name = self._img_basename(game_name) + ".png"
+        img_path = self.img_dir / img_name
+        if img_path.exists():
+            os.remove(img_path)
+            print(f"✓ Deleted thumbnail: {img_path}")
 
     # --- Duplicate Management ---
 
-    def find_duplicates(self):
-        """Find duplicate entries in Gams.html."""
+    def find_duplicates(self, check_files: bool = False):
+        """Find duplicate entries in Gams.html.
+        
+        With check_files, also report byte-identical files in g/g/ (this
+        reads the files, so it is opt-in).
+        """
         self.clear_screen()
         print("\n🔍 Scanning for duplicates...")
         entries = self.parse_gams_list()
@@ -399,6 +938,12 @@ class GamsManager:
                 else:
                     seen_names[name] = True
         
+        identical = self.find_duplicate_files() if check_files else []
+        if identical:
+            print(f"⚠️  Found {len(identical)} sets of identical files in g/g/:")
+            for group in identical:
+                print(f"  - {', '.join(path.name for path in group)}")
+        
         if duplicates:
             print(f"⚠️  Found {len(duplicates)} duplicate game names:")
             for name in duplicates:
@@ -410,36 +955,105 @@ class GamsManager:
             print("✓ No duplicate names found.")
             input("\nPress Enter to continue...")
 
+    def find_duplicate_files(self) -> List[List[Path]]:
+        """Find groups of byte-identical game files in g/g/.
+        
+        Files are bucketed by size, then by a hash of their first 4 KiB, and
+        only the survivors are hashed in full and compared byte for byte.
+        """
+        by_size: Dict[int, List[Path]] = defaultdict(list)
+        try:
+            with os.scandir(self.games_dir) as it:
+                for item in it:
+                    try:
+                        if item.is_file(follow_symlinks=False):
+                            by_size[item.stat(follow_symlinks=False).st_size].append(Path(item.path))
+                    except OSError:
+                        continue
+        except OSError as e:
+            print(f"✗ Error scanning {self.games_dir}: {e}")
+            return []
+        
+        def narrow(groups, digest):
+            # Re-bucket every group by digest, dropping files left on their own
+            narrowed = []
+            for group in groups:
+                buckets = defaultdict(list)
+                for path in group:
+                    try:
+                        buckets[digest(path)].append(path)
+                    except OSError:
+                        continue
+                narrowed.extend(b for b in buckets.values() if len(b) > 1)
+            return narrowed
+        
+        def prefix_digest(path: Path) -> bytes:
+            with open(path, 'rb') as f:
+                return hashlib.blake2b(f.read(_DUPE_PREFIX_BYTES)).digest()
+        
+        def full_digest(path: Path) -> bytes:
+            digest = hashlib.blake2b()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+            return digest.digest()
+        
+        def same_contents(first: Path, other: Path) -> bool:
+            # A file removed or replaced mid-scan simply isn't a duplicate
+            try:
+                return filecmp.cmp(first, other, shallow=False)
+            except OSError:
+                return False
+        
+        # Empty files are skipped; files no longer than the prefix are fully
+        # covered by its hash
+        small, large = [], []
+        for size, group in by_size.items():
+            if size and len(group) > 1:
+                (small if size <= _DUPE_PREFIX_BYTES else large).append(group)
+        candidates = narrow(small, prefix_digest) + narrow(narrow(large, prefix_digest), full_digest)
+        
+        # Confirm hash matches with an exact comparison against the first file
+        identical = []
+        for group in candidates:
+            first = group[0]
+            same = [first] + [path for path in group[1:] if same_contents(first, path)]
+            if len(same) > 1:
+                identical.append(sorted(same))
+        return sorted(identical)
+
     def remove_duplicates(self, duplicate_names: List[str]):
         """Remove duplicate entries, keeping the first one."""
+        checkpoint = None
         try:
-            with open(self.gams_html, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            new_lines = []
+            checkpoint = self._gams_checkpoint()
+            content = checkpoint[0]
+            duplicates = set(duplicate_names)
             seen = set()
             
-            for line in lines:
-                is_duplicate_line = False
-                for name in duplicate_names:
-                    if f'name: "{name}"' in line:
-                        if name in seen:
-                            is_duplicate_line = True
-                            print(f"  - Removing duplicate line for '{name}'")
-                        else:
-                            seen.add(name)
-                        break
-                
-                if not is_duplicate_line:
-                    new_lines.append(line)
+            # A single pass pulls the name out of every entry line and checks it
+            # against a set, so the cost does not grow with the number of
+            # duplicate names; repeat lines are substituted away in place
+            def drop_repeat(match):
+                name = match.group(1)
+                if name not in duplicates:
+                    return match.group(0)
+                if name in seen:
+                    print(f"  - Removing duplicate line for '{name}'")
+                    return ''
+                seen.add(name)
+                return match.group(0)
             
-            with open(self.gams_html, 'w', encoding='utf-8') as f:
-                f.writelines(new_lines)
+            self._set_gams_content(_NAME_LINE_RE.sub(drop_repeat, content))
+            if not self.flush():
+                self._gams_rollback(checkpoint)
+                return
                 
             print("✓ Duplicates removed from Gams.html")
             input("\nPress Enter to continue...")
             
         except Exception as e:
+            self._gams_rollback(checkpoint)
             print(f"✗ Error removing duplicates: {e}")
 
     def find_orphaned_files(self):
@@ -450,9 +1064,9 @@ class GamsManager:
         linked_files = set()
         
         # Explicit whitelist for system files/dirs
-        whitelist = {
+        whitelist = frozenset({
             "Gam.html", "misc", "Ruffle", "webretro", "assets", "img"
-        }
+        })
         
         for entry in entries:
             if 'href' in entry:
@@ -468,10 +1082,13 @@ class GamsManager:
                     else:
                         linked_files.add(parts[2]) # Add filename
         
+        # scandir entries carry the file type from readdir, so is_dir()
+        # below needs no extra stat per item
         orphans = []
-        for item in self.games_dir.iterdir():
-            if item.name not in linked_files and item.name not in whitelist:
-                orphans.append(item)
+        with os.scandir(self.games_dir) as it:
+            for item in it:
+                if item.name not in linked_files and item.name not in whitelist:
+                    orphans.append(item)
         
         if orphans:
             print(f"⚠️  Found {len(orphans)} orphaned items in g/g/:")
@@ -482,9 +1099,9 @@ class GamsManager:
                 for item in orphans:
                     try:
                         if item.is_dir():
-                            shutil.rmtree(item)
+                            shutil.rmtree(item.path)
                         else:
-                            os.remove(item)
+                            os.remove(item.path)
                         print(f"  ✓ Deleted {item.name}")
                     except Exception as e:
                         print(f"  ✗ Error deleting {item.name}: {e}")
@@ -496,38 +1113,60 @@ class GamsManager:
     def assign_game_image(self, game_name: str, image_source: Optional[str] = None) -> bool:
         """Assign an image to a specific game (default Gams logo or custom URL)."""
         self.clear_screen()
+        success = self._assign_image(game_name, image_source)
+        input("\nPress Enter to continue...")
+        return success
+
+    def assign_game_images(self, pairs: List[Tuple[str, Optional[str]]], pause: bool = True) -> int:
+        """Assign images to several (game_name, image_url or None) pairs.
+        
+        The screen is cleared and Enter awaited once for the whole batch.
+        With pause=False nothing waits for Enter (e.g. stdin is not a TTY).
+        """
+        self.clear_screen()
+        assigned = sum(self._assign_image(game_name, image_source)
+                       for game_name, image_source in pairs)
+        print(f"\n🎉 Assigned {assigned}/{len(pairs)} thumbnails")
+        if pause:
+            input("\nPress Enter to continue...")
+        return assigned
+
+    def _assign_image(self, game_name: str, image_source: Optional[str] = None) -> bool:
+        """Write one game's thumbnail from a URL or the default logo."""
         print(f"\n🖼️  Assigning image to: {game_name}")
         
         # Convert game name to filename
-        img_filename = f"{game_name.lower().replace(' ', '')}.png"
+        img_filename = f"{self._img_basename(game_name)}.png"
         img_path = self.img_dir / img_filename
         
         try:
             if image_source:
                 # Custom URL provided
                 print(f"📥 Downloading image from: {image_source}")
-                response = requests.get(image_source, timeout=15)
+                response = self.session.get(image_source, timeout=15)
                 response.raise_for_status()
                 
-                with open(img_path, 'wb') as f:
-                    f.write(response.content)
+                # Replacing the path rather than writing through it leaves the logo
+                # alone if an older version left this thumbnail hardlinked to it
+                _atomic_write_bytes(img_path, response.content)
                 print(f"✓ Downloaded and assigned custom thumbnail: {img_path}")
             else:
                 # Use default Gams logo
                 if not self.default_image.exists():
                     print(f"✗ Default Gams logo not found at {self.default_image}")
-                    input("\nPress Enter to continue...")
                     return False
                 
-                shutil.copy2(self.default_image, img_path)
+                if img_path != self.default_image:
+                    # Thumbnails from older versions may be hardlinks to the
+                    # logo; unlinking first keeps copy2 from writing through them
+                    img_path.unlink(missing_ok=True)
+                    shutil.copy2(self.default_image, img_path)
                 print(f"✓ Assigned default thumbnail: {img_path}")
             
-            input("\nPress Enter to continue...")
             return True
             
         except Exception as e:
             print(f"✗ Error assigning image: {e}")
-            input("\nPress Enter to continue...")
             return False
 
     def backup_config(self):
@@ -536,6 +1175,9 @@ class GamsManager:
         timestamp = int(time.time())
         backup_path = self.base_dir / f"Gams.html.bak.{timestamp}"
         try:
+            # Back up what the user sees, including queued edits
+            if not self.flush():
+                raise OSError("could not write pending edits to Gams.html")
             shutil.copy2(self.gams_html, backup_path)
             print(f"✓ Backup created: {backup_path}")
             input("\nPress Enter to continue...")
@@ -548,157 +1190,9 @@ class GamsManager:
     # --- Main Interface ---
 
     def interactive_menu(self):
-        """Main interactive menu."""
-        while True:
-            self.clear_screen()
-            print("\n🎮 Gams Management Console")
-            print("=" * 50)
-            print("1. Add New Game")
-            print("2. Delete Game")
-            print("3. Find Duplicates")
-            print("4. Clean Orphaned Files")
-            print("5. List All Games")
-            print("6. Assign Default Image")
-            print("7. Backup Gams.html")
-            print("8. Exit")
-            
-            choice = input("\nSelect option (1-8): ").strip()
-            
-            if choice == '1':
-                self.interactive_add_menu()
-            elif choice == '2':
-                self.interactive_delete_menu()
-            elif choice == '3':
-                self.find_duplicates()
-            elif choice == '4':
-                self.find_orphaned_files()
-            elif choice == '5':
-                self.list_installed_games()
-            elif choice == '6':
-                self.interactive_assign_image_menu()
-            elif choice == '7':
-                self.backup_config()
-            elif choice == '8':
-                self.clear_screen()
-                print("👋 Goodbye!")
-                break
-            else:
-                print("❌ Invalid option")
-                time.sleep(1)
-
-    def interactive_add_menu(self):
-        """Sub-menu for adding games."""
-        self.clear_screen()
-        print("\n➕ Add Game Menu")
-        print("1. Search for a game")
-        print("2. Browse by letter")
-        print("3. Back to Main Menu")
-        
-        choice = input("\nSelect option (1-3): ").strip()
-        
-        if choice == '1':
-            self.search_and_add()
-        elif choice == '2':
-            self.browse_by_letter()
-        elif choice == '3':
-            return
-        else:
-            print("❌ Invalid option")
-            time.sleep(1)
-
-    def interactive_delete_menu(self):
-        """Sub-menu for deleting games."""
-        self.clear_screen()
-        print("\n🗑️  Delete Game Menu")
-        entries = self.parse_gams_list()
-        games = [e['name'] for e in entries if 'name' in e]
-        
-        print(f"Found {len(games)} installed games.")
-        search = input("Enter game name to search (or ENTER to list all): ").strip().lower()
-        
-        matches = [g for g in games if search in g.lower()]
-        
-        if not matches:
-            print("No games found.")
-            input("\nPress Enter to continue...")
-            return
-            
-        print("\nSelect game to delete:")
-        for i, game in enumerate(matches[:20], 1):
-            print(f"{i}. {game}")
-        if len(matches) > 20:
-            print(f"...and {len(matches)-20} more")
-            
-        try:
-            sel = input("\nSelect number (0 to cancel): ").strip()
-            if not sel or sel == '0':
-                return
-                
-            idx = int(sel) - 1
-            if 0 <= idx < len(matches):
-                game_to_delete = matches[idx]
-                confirm = input(f"Are you sure you want to delete '{game_to_delete}'? (yes/no): ")
-                if confirm.lower() == 'yes':
-                    self.delete_game(game_to_delete)
-                    input("\nPress Enter to continue...")
-            else:
-                print("❌ Invalid selection")
-        except ValueError:
-            print("❌ Invalid input")
-
-    def interactive_assign_image_menu(self):
-        """Sub-menu for assigning default image to games."""
-        self.clear_screen()
-        print("\n🖼️  Assign Image Menu")
-        entries = self.parse_gams_list()
-        games = [e['name'] for e in entries if 'name' in e]
-        
-        print(f"Found {len(games)} installed games.")
-        search = input("Enter game name to search (or ENTER to list all): ").strip().lower()
-        
-        matches = [g for g in games if search in g.lower()]
-        
-        if not matches:
-            print("No games found.")
-            input("\nPress Enter to continue...")
-            return
-            
-        print("\nSelect game to assign image:")
-        for i, game in enumerate(matches[:20], 1):
-            print(f"{i}. {game}")
-        if len(matches) > 20:
-            print(f"...and {len(matches)-20} more")
-            
-        try:
-            sel = input("\nSelect number (0 to cancel): ").strip()
-            if not sel or sel == '0':
-                return
-                
-            idx = int(sel) - 1
-            if 0 <= idx < len(matches):
-                game_to_update = matches[idx]
-                
-                # Ask for image source
-                print("\nImage source options:")
-                print("1. Use default Gams logo")
-                print("2. Provide custom image URL")
-                
-                img_choice = input("Select option (1-2): ").strip()
-                
-                if img_choice == '1':
-                    self.assign_game_image(game_to_update)
-                elif img_choice == '2':
-                    url = input("Enter image URL: ").strip()
-                    if url:
-                        self.assign_game_image(game_to_update, url)
-                    else:
-                        print("❌ No URL provided")
-                else:
-                    print("❌ Invalid option")
-            else:
-                print("❌ Invalid selection")
-        except ValueError:
-            print("❌ Invalid input")
+        """Main interactive menu (see manage_gams_interactive)."""
+        from manage_gams_interactive import run
+        run(self)
 
     def list_installed_games(self):
         """List all games currently in Gams.html."""
@@ -717,98 +1211,153 @@ class GamsManager:
         print(f"\nTotal entries: {len([e for e in entries if 'name' in e])}")
         input("\nPress Enter to continue...")
 
-    # Copy of helper methods from original adder for compatibility
-    def search_and_add(self):
-        query = input("🔍 Enter search term: ").strip()
-        if not query: return
-        matches = self.search_games(query)
-        if not matches:
-            print("❌ No games found")
-            input("\nPress Enter to continue...")
-            return
-        print(f"\n📋 Found {len(matches)} games:")
-        for i, game in enumerate(matches[:10], 1):
-            name = self.get_game_name(game)
-            print(f"{i:2d}. {name}")
-        if len(matches) > 10: print(f"... and {len(matches) - 10} more")
-        try:
-            selection = input(f"\nSelect game (1-{min(10, len(matches))}): ").strip()
-            idx = int(selection) - 1
-            if 0 <= idx < min(10, len(matches)):
-                self.process_game_selection(matches[idx])
-        except ValueError: print("❌ Invalid input")
-
-    def browse_by_letter(self):
-        games = self.load_ugs_games()
-        letters = sorted(set(game[2:3].upper() if game.startswith('cl') and len(game) > 2 else 'A' for game in games))
-        print(f"\n📚 Available letters: {' '.join(letters)}")
-        letter = input("🔤 Enter letter: ").strip().upper()
-        if letter not in letters:
-            print("❌ Invalid letter")
-            input("\nPress Enter to continue...")
-            return
-        filtered = [game for game in games if game.startswith('cl') and len(game) > 2 and game[2:3].upper() == letter]
-        print(f"\n📋 Games starting with '{letter}':")
-        for i, game in enumerate(filtered[:10], 1):
-            name = self.get_game_name(game)
-            print(f"{i:2d}. {name}")
-        try:
-            selection = input(f"\nSelect game (1-{min(10, len(filtered))}): ").strip()
-            idx = int(selection) - 1
-            if 0 <= idx < min(10, len(filtered)):
-                self.process_game_selection(filtered[idx])
-        except ValueError: print("❌ Invalid input")
-
-    def process_game_selection(self, game_id: str):
-        default_name = self.get_game_name(game_id)
-        print(f"\n🎮 Selected: {default_name}")
-        
-        # Ask for custom name
-        custom_name = input(f"Enter game name (press ENTER for '{default_name}'): ").strip()
-        game_name = custom_name if custom_name else default_name
-        
-        print("📂 Available sections:")
-        for i, section in enumerate(self.sections, 1):
-            print(f"{i}. {section}")
-        try:
-            section_choice = input(f"Select section (1-{len(self.sections)}): ").strip()
-            idx = int(section_choice) - 1
-            if 0 <= idx < len(self.sections):
-                section = self.sections[idx]
-                custom_img = input("Use custom image? (y/N): ").strip().lower()
-                self.add_game_with_name(game_id, game_name, section, custom_img.startswith('y'))
-                input("\nPress Enter to continue...")
-            else:
-                print("❌ Invalid section")
-        except ValueError: print("❌ Invalid input")
-
-
-def main():
-    manager = GamsManager()
-    
-    if len(sys.argv) > 1:
-        # Simple CLI arguments handling
-        cmd = sys.argv[1]
-        if cmd == 'add' and len(sys.argv) >= 3:
-            manager.add_game(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else "Custom")
-        elif cmd == 'delete' and len(sys.argv) >= 3:
-            manager.delete_game(sys.argv[2])
-        elif cmd == 'duplicates':
-            manager.find_duplicates()
-        elif cmd == 'orphans':
-            manager.find_orphaned_files()
-        elif cmd == 'list':
-            manager.list_installed_games()
-        elif cmd == 'assign-image' and len(sys.argv) >= 3:
-            manager.assign_game_image(sys.argv[2])
-        elif cmd == 'assign-custom-image' and len(sys.argv) >= 4:
-            manager.assign_game_image(sys.argv[2], sys.argv[3])
-        elif cmd == 'backup':
-            manager.backup_config()
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser; an empty command means interactive mode."""
+    parser = argparse.ArgumentParser(
+        prog="manage_gams.py",
+        usage=_USAGE,
+        description="Gams Master Management Script. Run without a command for the interactive menu.",
+    )
+    sub = parser.add_subparsers(dest="cmd", metavar="command", prog="manage_gams.py")
+    
+    add = sub.add_parser("add", help="download UGS games and add them to Gams.html")
+    add.add_argument("game_ids", nargs="+", metavar="game_id",
+                     help="UGS game IDs; 'add <game_id> <section>' is also accepted")
+    add.add_argument("-s", "--section", choices=SECTIONS, metavar="SECTION",
+                     help=f"section to add to (default: Custom; one of: {', '.join(SECTIONS)})")
+    
+    delete = sub.add_parser("delete", help="remove games' entries, files and thumbnails")
+    delete.add_argument("game_names", nargs="+", metavar="game_name")
+    
+    duplicates = sub.add_parser("duplicates", help="find duplicate entries in Gams.html")
+    duplicates.add_argument("--files", action="store_true",
+                            help="also report byte-identical files in g/g/ (reads every file)")
+    sub.add_parser("orphans", help="find files in g/g/ that Gams.html does not link")
+    sub.add_parser("list", help="list installed games by section")
+    
+    assign = sub.add_parser("assign-image", help="give a game the default Gams thumbnail")
+    assign.add_argument("game_name")
+    
+    assign_custom = sub.add_parser("assign-custom-image", help="download a game's thumbnail from a URL")
+    assign_custom.add_argument("game_name")
+    assign_custom.add_argument("image_url")
+    
+    assign_bulk = sub.add_parser("assign-images-bulk", help="assign thumbnails from a TSV or JSON file")
+    assign_bulk.add_argument("pairs_file", help="TSV lines of 'game<TAB>[url]', a JSON list of "
+                             "[game, url or null] pairs, or - for TSV on stdin")
+    
+    sub.add_parser("backup", help="write a timestamped copy of Gams.html")
+    return parser
+
+
+def _add_args(args: argparse.Namespace) -> Tuple[List[str], str]:
+    """Resolve the add command's game IDs and section before anything is downloaded."""
+    game_ids, section = args.game_ids, args.section
+    # The original `add <game_id> <section>` form
+    if section is None and len(game_ids) == 2:
+        game_ids, section = game_ids[:1], game_ids[1]
+        if section not in SECTIONS:
+            _PARSER.error(f"unknown section '{section}' (choose from {', '.join(SECTIONS)}); "
+                          f"use -s/--section to add several games")
+    return game_ids, section or "Custom"
+
+
+def _cli_add(manager: GamsManager, game_ids: List[str], section: str):
+    """Add one game, or download a batch in parallel."""
+    if len(game_ids) == 1:
+        manager.add_game(game_ids[0], section)
+    else:
+        manager.add_games_batch(game_ids, section)
+
+
+def _cli_delete(manager: GamsManager, game_names: List[str]):
+    """Delete one game, or a batch with a single Gams.html rewrite."""
+    if len(game_names) == 1:
+        manager.delete_game(game_names[0])
+    else:
+        manager.delete_games(game_names)
+
+
+def _cli_assign_images(manager: GamsManager, pairs_file: str):
+    """Read (game, image URL) pairs from a TSV/JSON file and assign them in one pass."""
+    try:
+        if pairs_file == '-':
+            text = sys.stdin.read()
+        else:
+            text = Path(pairs_file).read_text(encoding='utf-8')
+        
+        pairs = []
+        if pairs_file.endswith('.json'):
+            items = json.loads(text)
+            if not isinstance(items, list):
+                raise ValueError("expected a JSON list of [game, url or null] pairs")
+            for item in items:
+                if not (isinstance(item, list) and len(item) == 2 and isinstance(item[0], str)
+                        and isinstance(item[1], (str, type(None)))):
+                    raise ValueError(f"expected [game, url or null] pairs, got {item!r}")
+                pairs.append((item[0].strip(), item[1] or None))
         else:
-            print("Usage: manage_gams.py [add|delete|duplicates|orphans|list|assign-image|assign-custom-image|backup] [args...]")
+            # Blank lines and # comments are skipped; a missing URL means the default logo
+            for line in text.splitlines():
+                if line.strip() and not line.lstrip().startswith('#'):
+                    game, _, url = line.partition('\t')
+                    pairs.append((game.strip(), url.strip() or None))
+        if not all(game for game, _ in pairs):
+            raise ValueError("every entry needs a game name")
+    except (OSError, ValueError) as e:
+        print(f"✗ Could not read image assignments from {pairs_file}: {e}")
+        return
+    
+    # Pairs piped in on stdin use it up, so there is nothing to wait on
+    manager.assign_game_images(pairs, pause=pairs_file != '-' and sys.stdin.isatty())
+
+
+# CLI commands: name -> (method, parsed args -> method args). Keys are
+# interned so a command interned from argv matches on identity
+DISPATCH = {
+    sys.intern("add"): (_cli_add, _add_args),
+    sys.intern("delete"): (_cli_delete, lambda a: (a.game_names,)),
+    sys.intern("duplicates"): (GamsManager.find_duplicates, lambda a: (a.files,)),
+    sys.intern("orphans"): (GamsManager.find_orphaned_files, lambda a: ()),
+    sys.intern("list"): (GamsManager.list_installed_games, lambda a: ()),
+    sys.intern("assign-image"): (GamsManager.assign_game_image, lambda a: (a.game_name,)),
+    sys.intern("assign-custom-image"): (GamsManager.assign_game_image, lambda a: (a.game_name, a.image_url)),
+    sys.intern("assign-images-bulk"): (_cli_assign_images, lambda a: (a.pairs_file,)),
+    sys.intern("backup"): (GamsManager.backup_config, lambda a: ()),
+}
+_VALID_CMDS = frozenset(DISPATCH)
+_USAGE = "manage_gams.py [-h] [" + "|".join(DISPATCH) + "] [args...]"
+
+# Built once at import; main() reuses it on every call
+_PARSER = _build_parser()
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv:
+        argv[0] = sys.intern(argv[0])
+    
+    # Unknown commands fail on one set lookup, before any further setup
+    if argv and argv[0] not in _VALID_CMDS and not argv[0].startswith('-'):
+        _PARSER.error(f"unknown command '{argv[0]}'")
+    
+    try:
+        # Shell completion when argcomplete is installed and registered
+        import argcomplete
+        argcomplete.autocomplete(_PARSER)
+    except ImportError:
+        pass
+    
+    # Usage errors exit here, before the manager is built
+    args = _PARSER.parse_args(argv)
+    if args.cmd:
+        method, get_args = DISPATCH[args.cmd]
+        # Argument checks run before the manager is built
+        call_args = get_args(args)
+        method(GamsManager(), *call_args)
     else:
-        manager.interactive_menu()
+        from manage_gams_interactive import run
+        run(GamsManager())
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,237 @@
+"""
+Gams Interactive Console
+Menu-driven front end for GamsManager, loaded only when manage_gams.py
+runs without arguments.
+"""
+
+import atexit
+import time
+
+
+def run(manager):
+    """Main interactive menu."""
+    # Adds made from the menus are queued; don't lose them if the session
+    # is interrupted before the menu flushes
+    atexit.register(manager.flush)
+    
+    while True:
+        manager.clear_screen()
+        print("\n🎮 Gams Management Console")
+        print("=" * 50)
+        print("1. Add New Game")
+        print("2. Delete Game")
+        print("3. Find Duplicates")
+        print("4. Clean Orphaned Files")
+        print("5. List All Games")
+        print("6. Assign Default Image")
+        print("7. Backup Gams.html")
+        print("8. Exit")
+        
+        choice = input("\nSelect option (1-8): ").strip()
+        
+        if choice == '1':
+            add_menu(manager)
+            manager.flush()
+        elif choice == '2':
+            delete_menu(manager)
+        elif choice == '3':
+            manager.find_duplicates()
+        elif choice == '4':
+            manager.find_orphaned_files()
+        elif choice == '5':
+            manager.list_installed_games()
+        elif choice == '6':
+            assign_image_menu(manager)
+        elif choice == '7':
+            manager.backup_config()
+        elif choice == '8':
+            manager.flush()
+            manager.clear_screen()
+            print("👋 Goodbye!")
+            break
+        else:
+            print("❌ Invalid option")
+            time.sleep(1)
+
+
+def add_menu(manager):
+    """Sub-menu for adding games."""
+    manager.clear_screen()
+    print("\n➕ Add Game Menu")
+    print("1. Search for a game")
+    print("2. Browse by letter")
+    print("3. Back to Main Menu")
+    
+    choice = input("\nSelect option (1-3): ").strip()
+    
+    if choice == '1':
+        search_and_add(manager)
+    elif choice == '2':
+        browse_by_letter(manager)
+    elif choice == '3':
+        return
+    else:
+        print("❌ Invalid option")
+        time.sleep(1)
+
+
+def delete_menu(manager):
+    """Sub-menu for deleting games."""
+    manager.clear_screen()
+    print("\n🗑️  Delete Game Menu")
+    entries = manager.parse_gams_list()
+    games = [e['name'] for e in entries if 'name' in e]
+    
+    print(f"Found {len(games)} installed games.")
+    search = input("Enter game name to search (or ENTER to list all): ").strip().lower()
+    
+    matches = [g for g in games if search in g.lower()]
+    
+    if not matches:
+        print("No games found.")
+        input("\nPress Enter to continue...")
+        return
+        
+    print("\nSelect game to delete:")
+    for i, game in enumerate(matches[:20], 1):
+        print(f"{i}. {game}")
+    if len(matches) > 20:
+        print(f"...and {len(matches)-20} more")
+        
+    try:
+        sel = input("\nSelect number (0 to cancel): ").strip()
+        if not sel or sel == '0':
+            return
+            
+        idx = int(sel) - 1
+        if 0 <= idx < len(matches):
+            game_to_delete = matches[idx]
+            confirm = input(f"Are you sure you want to delete '{game_to_delete}'? (yes/no): ")
+            if confirm.lower() == 'yes':
+                manager.delete_game(game_to_delete)
+                input("\nPress Enter to continue...")
+        else:
+            print("❌ Invalid selection")
+    except ValueError:
+        print("❌ Invalid input")
+
+
+def assign_image_menu(manager):
+    """Sub-menu for assigning default image to games."""
+    manager.clear_screen()
+    print("\n🖼️  Assign Image Menu")
+    entries = manager.parse_gams_list()
+    games = [e['name'] for e in entries if 'name' in e]
+    
+    print(f"Found {len(games)} installed games.")
+    search = input("Enter game name to search (or ENTER to list all): ").strip().lower()
+    
+    matches = [g for g in games if search in g.lower()]
+    
+    if not matches:
+        print("No games found.")
+        input("\nPress Enter to continue...")
+        return
+        
+    print("\nSelect game to assign image:")
+    for i, game in enumerate(matches[:20], 1):
+        print(f"{i}. {game}")
+    if len(matches) > 20:
+        print(f"...and {len(matches)-20} more")
+        
+    try:
+        sel = input("\nSelect number (0 to cancel): ").strip()
+        if not sel or sel == '0':
+            return
+            
+        idx = int(sel) - 1
+        if 0 <= idx < len(matches):
+            game_to_update = matches[idx]
+            
+            # Ask for image source
+            print("\nImage source options:")
+            print("1. Use default Gams logo")
+            print("2. Provide custom image URL")
+            
+            img_choice = input("Select option (1-2): ").strip()
+            
+            if img_choice == '1':
+                manager.assign_game_image(game_to_update)
+            elif img_choice == '2':
+                url = input("Enter image URL: ").strip()
+                if url:
+                    manager.assign_game_image(game_to_update, url)
+                else:
+                    print("❌ No URL provided")
+            else:
+                print("❌ Invalid option")
+        else:
+            print("❌ Invalid selection")
+    except ValueError:
+        print("❌ Invalid input")
+
+
+def search_and_add(manager):
+    query = input("🔍 Enter search term: ").strip()
+    if not query: return
+    matches = manager.search_games(query)
+    if not matches:
+        print("❌ No games found")
+        input("\nPress Enter to continue...")
+        return
+    print(f"\n📋 Found {len(matches)} games:")
+    for i, game in enumerate(matches[:10], 1):
+        name = manager.get_game_name(game)
+        print(f"{i:2d}. {name}")
+    if len(matches) > 10: print(f"... and {len(matches) - 10} more")
+    try:
+        selection = input(f"\nSelect game (1-{min(10, len(matches))}): ").strip()
+        idx = int(selection) - 1
+        if 0 <= idx < min(10, len(matches)):
+            process_game_selection(manager, matches[idx])
+    except ValueError: print("❌ Invalid input")
+
+
+def browse_by_letter(manager):
+    letters = manager.available_letters()
+    print(f"\n📚 Available letters: {' '.join(letters)}")
+    letter = input("🔤 Enter letter: ").strip().upper()
+    if letter not in letters:
+        print("❌ Invalid letter")
+        input("\nPress Enter to continue...")
+        return
+    filtered = manager.search_entries_prefix(letter)
+    print(f"\n📋 Games starting with '{letter}':")
+    for i, entry in enumerate(filtered[:10], 1):
+        print(f"{i:2d}. {entry.display}")
+    try:
+        selection = input(f"\nSelect game (1-{min(10, len(filtered))}): ").strip()
+        idx = int(selection) - 1
+        if 0 <= idx < min(10, len(filtered)):
+            process_game_selection(manager, filtered[idx].id)
+    except ValueError: print("❌ Invalid input")
+
+
+def process_game_selection(manager, game_id: str):
+    default_name = manager.get_game_name(game_id)
+    print(f"\n🎮 Selected: {default_name}")
+    
+    # Ask for custom name
+    custom_name = input(f"Enter game name (press ENTER for '{default_name}'): ").strip()
+    game_name = custom_name if custom_name else default_name
+    
+    print("📂 Available sections:")
+    for i, section in enumerate(manager.sections, 1):
+        print(f"{i}. {section}")
+    try:
+        section_choice = input(f"Select section (1-{len(manager.sections)}): ").strip()
+        idx = int(section_choice) - 1
+        if 0 <= idx < len(manager.sections):
+            section = manager.sections[idx]
+            custom_img = input("Use custom image? (y/N): ").strip().lower()
+            # Queued; the main menu flushes Gams.html once the add menu returns
+            manager.add_game_with_name(game_id, game_name, section, custom_img.startswith('y'), flush=False)
+            input("\nPress Enter to continue...")
+        else:
+            print("❌ Invalid section")
+    except ValueError: print("❌ Invalid input")